@@ -1,25 +1,40 @@
 from __future__ import annotations
 
+import base64
+import functools
+import hashlib
+import hmac
 import json
 import os
-import secrets
 import ssl
+import threading
+import time
 import urllib.parse
-import urllib.request
 from pathlib import Path
-from urllib.error import HTTPError, URLError
 from typing import Dict, Optional
 
+import httpx
+from cachetools import TTLCache
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
+from jinja2 import DictLoader, Environment, select_autoescape
+
+from static_pages import StaticPage
 
 AUTH_COOKIE = "freelancing_auth"
 FREELANCER_INTAKE_PATH = "/ui/resume"
+_SUPPORTED_PROVIDERS = frozenset({"google"})
+SESSION_TTL_SECONDS = 86400
+OAUTH_STATE_TTL_SECONDS = 600
+USERINFO_TTL_SECONDS = 300
+LAST_PROFILE_TTL_SECONDS = 86400
 
 auth_router = APIRouter(prefix="/auth", tags=["auth"])
 
-_user_sessions: Dict[str, Dict[str, str]] = {}
-_pending_oauth_states: Dict[str, Dict[str, str]] = {}
+# Bounded local session store used when Redis is not configured: LRU-capped and
+# expiring after the same TTL as Redis sessions, so long-running workers stay flat.
+_user_sessions: TTLCache = TTLCache(maxsize=100_000, ttl=SESSION_TTL_SECONDS)
 
 
 def _load_env_file() -> None:
@@ -46,26 +61,139 @@ try:
 except ImportError:  # pragma: no cover
     certifi = None
 
+try:
+    import redis
+except ImportError:  # pragma: no cover
+    redis = None
 
-def get_authenticated_user(request: Request) -> Optional[Dict[str, str]]:
-    token = request.cookies.get(AUTH_COOKIE)
-    if not token:
-        return None
-    return _user_sessions.get(token)
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import minijinja
+except ImportError:  # pragma: no cover
+    minijinja = None
+
+# Sessions live in Redis when REDIS_URL is set so every worker sees the same map;
+# otherwise they fall back to the process-local dict. The client is synchronous, so
+# async routes hand each Redis call to the threadpool instead of blocking the loop.
+_redis = redis.Redis.from_url(os.environ["REDIS_URL"], decode_responses=True) if redis and os.getenv("REDIS_URL") else None
+
+# OAuth state is a signed, self-contained token verified on callback, so in-flight
+# logins need no server-side storage. Without AUTH_STATE_SECRET a per-process key is
+# generated, which only suits single-worker deployments.
+_STATE_SECRET = os.getenv("AUTH_STATE_SECRET", "").encode("utf-8") or os.urandom(32)
+
+# Short-lived local copy of Redis-backed sessions so a browser's request burst
+# costs one round trip instead of one per request.
+_session_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+# Cookies Redis had no session for (expired, logged out, or forged), so repeats skip the round trip too.
+_missing_sessions: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+# TTLCache is not thread-safe; sync routes read sessions from the threadpool.
+_session_lock = threading.Lock()
+
+# Google profiles keyed by sha256(access_token); raw tokens are never used as keys.
+_userinfo_cache: TTLCache = TTLCache(maxsize=1024, ttl=USERINFO_TTL_SECONDS)
+# Last good profile per Google subject, used only when AUTH_STALE_FALLBACK=1.
+_last_profiles: TTLCache = TTLCache(maxsize=10_000, ttl=LAST_PROFILE_TTL_SECONDS)
+
+# Shared client so the TCP+TLS handshake to Google is reused across callbacks.
+_HTTP = httpx.AsyncClient(
+    timeout=12.0,
+    verify=ssl.create_default_context(cafile=certifi.where()) if certifi is not None else ssl.create_default_context(),
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+)
+
+
+def _new_token(nbytes: int) -> str:
+    # Same output as secrets.token_urlsafe(nbytes) without the extra wrapper layer.
+    return base64.urlsafe_b64encode(os.urandom(nbytes)).rstrip(b"=").decode("ascii")
+
+
+def _save_session(token: str, user: Dict[str, str]) -> None:
+    if _redis is not None:
+        _redis.setex(f"sess:{token}", SESSION_TTL_SECONDS, json.dumps(user))
+        with _session_lock:
+            _missing_sessions.pop(token, None)
+        return
+    with _session_lock:
+        _user_sessions[token] = user
+
+
+def _load_session(token: str) -> Optional[Dict[str, str]]:
+    if _redis is None:
+        with _session_lock:
+            return _user_sessions.get(token)
+
+    with _session_lock:
+        user = _session_cache.get(token)
+        if user is None and token in _missing_sessions:
+            return None
+    if user is None:
+        raw = _redis.get(f"sess:{token}")
+        user = json.loads(raw) if raw else None
+        with _session_lock:
+            if user is not None:
+                _session_cache[token] = user
+            else:
+                _missing_sessions[token] = True
+    return user
+
+
+def _delete_session(token: str) -> None:
+    if _redis is not None:
+        _redis.delete(f"sess:{token}")
+        with _session_lock:
+            _session_cache.pop(token, None)
+            _missing_sessions[token] = True
+        return
+    with _session_lock:
+        _user_sessions.pop(token, None)
 
 
-def _ssl_context() -> ssl.SSLContext:
-    if certifi is not None:
-        return ssl.create_default_context(cafile=certifi.where())
-    return ssl.create_default_context()
+def _sign_oauth_state(payload: bytes) -> str:
+    # hmac.digest with a digest *name* runs as a single OpenSSL one-shot HMAC call
+    # (SHA-NI accelerated on modern x86) instead of the pure-Python HMAC object.
+    tag = hmac.digest(_STATE_SECRET, payload, "sha256")[:16]
+    return base64.urlsafe_b64encode(tag).rstrip(b"=").decode("ascii")
+
+
+def _encode_oauth_state(pending: Dict[str, str]) -> str:
+    claims = {
+        "p": pending["provider"],
+        "n": pending["next"],
+        "r": pending["redirect_uri"],
+        "x": int(time.time()) + OAUTH_STATE_TTL_SECONDS,
+        "k": _new_token(8),
+    }
+    payload = base64.urlsafe_b64encode(json.dumps(claims, separators=(",", ":")).encode("utf-8")).rstrip(b"=")
+    return f"{payload.decode('ascii')}.{_sign_oauth_state(payload)}"
+
+
+def _decode_oauth_state(state: str) -> Optional[Dict[str, str]]:
+    payload, _, signature = state.partition(".")
+    expected = _sign_oauth_state(payload.encode("utf-8"))
+    if not signature or not hmac.compare_digest(signature.encode("utf-8"), expected.encode("ascii")):
+        return None
+    try:
+        claims = _decode_json(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except ValueError:
+        return None
+    if claims.get("x", 0) < time.time():
+        return None
+    return {"provider": claims["p"], "next": claims["n"], "redirect_uri": claims["r"]}
 
 
-def _urlopen(request: urllib.request.Request, timeout: int = 12):
-    return urllib.request.urlopen(request, timeout=timeout, context=_ssl_context())
+def get_authenticated_user(request: Request) -> Optional[Dict[str, str]]:
+    token = request.cookies.get(AUTH_COOKIE)
+    if not token:
+        return None
+    return _load_session(token)
 
 
-def _auth_theme_styles() -> str:
-    return """
+_AUTH_THEME_STYLES = """
       <style>
         :root {
           --bg:#f8f5ff;
@@ -129,6 +257,18 @@ def _google_oauth_configured() -> bool:
     return bool(os.getenv("GOOGLE_CLIENT_ID") and os.getenv("GOOGLE_CLIENT_SECRET"))
 
 
+# Only state and redirect_uri vary per request; the rest of the consent URL is a
+# format string built once per client id.
+@functools.lru_cache(maxsize=4)
+def _google_auth_template(client_id: str) -> str:
+    return (
+        "https://accounts.google.com/o/oauth2/v2/auth?client_id="
+        + urllib.parse.quote(client_id, safe="")
+        + "&response_type=code&scope=openid+email+profile&access_type=online&include_granted_scopes=true"
+        + "&redirect_uri={redir}&state={state}"
+    )
+
+
 def _google_redirect_uri(request: Request) -> str:
     configured = os.getenv("GOOGLE_REDIRECT_URI")
     if configured:
@@ -136,97 +276,221 @@ def _google_redirect_uri(request: Request) -> str:
     return str(request.url_for("oauth_callback", provider="google"))
 
 
-def _build_login_page(next_url: str) -> str:
-    safe_next = urllib.parse.quote(next_url, safe="/")
-    return f"""
+_LOGIN_TEMPLATE = """
     <!DOCTYPE html>
-    <html lang=\"en\">
+    <html lang="en">
     <head>
-      <meta charset=\"UTF-8\" />
-      <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\" />
+      <meta charset="UTF-8" />
+      <meta name="viewport" content="width=device-width, initial-scale=1.0" />
       <title>Developer Login</title>
-      {_auth_theme_styles()}
+      {% include "_theme.html" %}
     </head>
     <body>
-      <main class=\"card\">
-        <div class=\"brand\"><span>Freelancing</span>AI</div>
+      <main class="card">
+        <div class="brand"><span>Freelancing</span>AI</div>
         <h1>Sign in as a freelancer</h1>
         <p>Continue with your Google account. You will be redirected to Google and returned to resume onboarding.</p>
-        <div class=\"actions\">
-          <a class=\"btn primary\" href=\"/auth/start/google?next={safe_next}\">Continue with Google</a>
+        <div class="actions">
+          <a class="btn primary" href="/auth/start/google?next={{ safe_next }}">Continue with Google</a>
         </div>
-        <p class=\"meta\">If login fails, open <code>/auth/config</code> and verify your OAuth setup.</p>
+        <p class="meta">If login fails, open <code>/auth/config</code> and verify your OAuth setup.</p>
       </main>
     </body>
     </html>
     """
 
-
-def _build_error_page(message: str) -> str:
-    return f"""
+_ERROR_TEMPLATE = """
     <!DOCTYPE html>
-    <html lang=\"en\">
+    <html lang="en">
     <head>
-      <meta charset=\"UTF-8\" />
-      <meta name=\"viewport\" content=\"width=device-width, initial-scale=1.0\" />
+      <meta charset="UTF-8" />
+      <meta name="viewport" content="width=device-width, initial-scale=1.0" />
       <title>Authentication Error</title>
-      {_auth_theme_styles()}
+      {% include "_theme.html" %}
     </head>
     <body>
-      <main class=\"card\">
-        <div class=\"brand\"><span>Freelancing</span>AI</div>
+      <main class="card">
+        <div class="brand"><span>Freelancing</span>AI</div>
         <h1>Authentication issue</h1>
-        <p class=\"warn\">{message}</p>
-        <div class=\"actions">
-          <a class=\"btn primary\" href=\"/auth/login\">Try again</a>
-          <a class=\"btn\" href=\"/auth/config\">Open OAuth Config Check</a>
+        <p class="warn">{{ message }}</p>
+        <div class="actions">
+          <a class="btn primary" href="/auth/login">Try again</a>
+          <a class="btn" href="/auth/config">Open OAuth Config Check</a>
         </div>
       </main>
     </body>
     </html>
     """
 
+_TEMPLATE_SOURCES = {"_theme.html": _AUTH_THEME_STYLES, "login.html": _LOGIN_TEMPLATE, "error.html": _ERROR_TEMPLATE}
 
-def _exchange_google_code_for_token(code: str, redirect_uri: str) -> Dict[str, str]:
-    payload = urllib.parse.urlencode(
-        {
-            "code": code,
-            "client_id": os.environ["GOOGLE_CLIENT_ID"],
-            "client_secret": os.environ["GOOGLE_CLIENT_SECRET"],
-            "redirect_uri": redirect_uri,
-            "grant_type": "authorization_code",
-        }
-    ).encode("utf-8")
+# Templates are parsed once; both engines autoescape .html templates, which keeps
+# provider/exception text out of the markup. MiniJinja (Rust) is preferred when installed.
+if minijinja is not None:
+    _TEMPLATES = minijinja.Environment(templates=_TEMPLATE_SOURCES)
+
+    def _render(name: str, **context: str) -> str:
+        return _TEMPLATES.render_template(name, **context)
 
-    req = urllib.request.Request(
-        "https://oauth2.googleapis.com/token",
-        data=payload,
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
-        method="POST",
+else:
+    _TEMPLATES = Environment(
+        loader=DictLoader(_TEMPLATE_SOURCES),
+        autoescape=select_autoescape(["html"]),
+        auto_reload=False,
     )
+
+    def _render(name: str, **context: str) -> str:
+        return _TEMPLATES.get_template(name).render(**context)
+
+
+@functools.lru_cache(maxsize=256)
+def _safe_next(next_url: str) -> str:
+    return urllib.parse.quote(next_url, safe="/")
+
+
+def _build_login_page(next_url: str) -> str:
+    return _render("login.html", safe_next=_safe_next(next_url))
+
+
+def _build_error_page(message: str) -> str:
+    return _render("error.html", message=message)
+
+
+_NOT_CONFIGURED_PAGE = _build_error_page(
+    "Google OAuth is not configured. Please set GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET."
+)
+
+
+# Login always sends users to the intake page, so the body (and its ETag) never varies.
+_LOGIN_PAGE = StaticPage(_build_login_page(FREELANCER_INTAKE_PATH).encode("utf-8"), cache_control="private, max-age=300")
+
+
+def _pending_login(provider: str, redirect_uri: str) -> Dict[str, str]:
+    return {"provider": provider, "next": FREELANCER_INTAKE_PATH, "redirect_uri": redirect_uri}
+
+
+class GoogleUnavailableError(RuntimeError):
+    """Google answered with a 5xx or could not be reached."""
+
+
+def _decode_json(payload: bytes) -> Dict[str, str]:
+    # orjson parses the raw body directly, skipping the bytes -> str decode.
+    if orjson is not None:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+
+async def _exchange_google_code_for_token(code: str, redirect_uri: str) -> Dict[str, str]:
     try:
-        with _urlopen(req, timeout=12) as response:
-            return json.loads(response.read().decode("utf-8"))
-    except HTTPError as exc:
-        body = exc.read().decode("utf-8", errors="ignore")
-        raise RuntimeError(f"token_exchange_failed: {exc.code} {body}") from exc
-    except URLError as exc:
+        response = await _HTTP.post(
+            "https://oauth2.googleapis.com/token",
+            data={
+                "code": code,
+                "client_id": os.environ["GOOGLE_CLIENT_ID"],
+                "client_secret": os.environ["GOOGLE_CLIENT_SECRET"],
+                "redirect_uri": redirect_uri,
+                "grant_type": "authorization_code",
+            },
+        )
+        response.raise_for_status()
+        return _decode_json(response.content)
+    except httpx.HTTPStatusError as exc:
+        raise RuntimeError(f"token_exchange_failed: {exc.response.status_code} {exc.response.text}") from exc
+    except httpx.RequestError as exc:
         raise RuntimeError(f"token_exchange_network_error: {exc}") from exc
 
 
-def _fetch_google_user_info(access_token: str) -> Dict[str, str]:
-    req = urllib.request.Request(
-        "https://openidconnect.googleapis.com/v1/userinfo",
-        headers={"Authorization": f"Bearer {access_token}"},
-    )
+async def _cached_user_info(cache_key: str) -> Optional[Dict[str, str]]:
+    profile = _userinfo_cache.get(cache_key)
+    if profile is None and _redis is not None:
+        raw = await run_in_threadpool(_redis.get, f"gginfo:{cache_key}")
+        if raw:
+            profile = json.loads(raw)
+            _userinfo_cache[cache_key] = profile
+    return profile
+
+
+async def _remember_user_info(cache_key: str, profile: Dict[str, str]) -> None:
+    _userinfo_cache[cache_key] = profile
+    if _redis is not None:
+        await run_in_threadpool(_redis.setex, f"gginfo:{cache_key}", USERINFO_TTL_SECONDS, json.dumps(profile))
+
+
+async def _fetch_google_user_info(access_token: str) -> Dict[str, str]:
+    cache_key = hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+    profile = await _cached_user_info(cache_key)
+    if profile is not None:
+        return profile
+
     try:
-        with _urlopen(req, timeout=12) as response:
-            return json.loads(response.read().decode("utf-8"))
-    except HTTPError as exc:
-        body = exc.read().decode("utf-8", errors="ignore")
-        raise RuntimeError(f"userinfo_fetch_failed: {exc.code} {body}") from exc
-    except URLError as exc:
-        raise RuntimeError(f"userinfo_network_error: {exc}") from exc
+        response = await _HTTP.get(
+            "https://openidconnect.googleapis.com/v1/userinfo",
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+        response.raise_for_status()
+        profile = _decode_json(response.content)
+    except httpx.HTTPStatusError as exc:
+        error_cls = GoogleUnavailableError if exc.response.status_code >= 500 else RuntimeError
+        raise error_cls(f"userinfo_fetch_failed: {exc.response.status_code} {exc.response.text}") from exc
+    except httpx.RequestError as exc:
+        raise GoogleUnavailableError(f"userinfo_network_error: {exc}") from exc
+
+    await _remember_user_info(cache_key, profile)
+    return profile
+
+
+def _stale_fallback_enabled() -> bool:
+    return os.getenv("AUTH_STALE_FALLBACK") == "1"
+
+
+def _id_token_subject(token_payload: Dict[str, str]) -> str:
+    # The id_token comes straight from Google's token endpoint over TLS; its claims
+    # are only used here as a lookup key for a previously verified profile.
+    try:
+        claims_segment = token_payload.get("id_token", "").split(".")[1]
+        claims = _decode_json(base64.urlsafe_b64decode(claims_segment + "=" * (-len(claims_segment) % 4)))
+    except (IndexError, ValueError):
+        return ""
+    return str(claims.get("sub", ""))
+
+
+async def _remember_last_profile(profile: Dict[str, str]) -> None:
+    subject = profile.get("sub")
+    if not subject:
+        return
+    _last_profiles[subject] = profile
+    if _redis is not None:
+        await run_in_threadpool(_redis.setex, f"profile:last:{subject}", LAST_PROFILE_TTL_SECONDS, json.dumps(profile))
+
+
+async def _last_known_profile(subject: str) -> Optional[Dict[str, str]]:
+    if not subject:
+        return None
+    profile = _last_profiles.get(subject)
+    if profile is None and _redis is not None:
+        raw = await run_in_threadpool(_redis.get, f"profile:last:{subject}")
+        profile = json.loads(raw) if raw else None
+    return profile
+
+
+async def _resolve_google_profile(access_token: str, token_payload: Dict[str, str]) -> Dict[str, str]:
+    if not _stale_fallback_enabled():
+        return await _fetch_google_user_info(access_token)
+
+    try:
+        profile = await _fetch_google_user_info(access_token)
+    except GoogleUnavailableError:
+        stale = await _last_known_profile(_id_token_subject(token_payload))
+        if stale is None:
+            raise
+        return {**stale, "provenance": "stale"}
+    await _remember_last_profile(profile)
+    return profile
+
+
+@auth_router.on_event("shutdown")
+async def close_http_client() -> None:
+    await _HTTP.aclose()
 
 
 @auth_router.get("/config")
@@ -249,74 +513,62 @@ def current_user(request: Request):
 
 
 @auth_router.get("/login", response_class=HTMLResponse)
-def login_page(next: str = FREELANCER_INTAKE_PATH) -> str:
+def login_page(request: Request, next: str = FREELANCER_INTAKE_PATH) -> Response:
     _ = next
-    return _build_login_page(FREELANCER_INTAKE_PATH)
+    return _LOGIN_PAGE.response(request)
 
 
 @auth_router.get("/start/{provider}")
 def start_login(provider: str, request: Request, next: str = FREELANCER_INTAKE_PATH):
     provider = provider.lower()
-    if provider != "google":
+    if provider not in _SUPPORTED_PROVIDERS:
         raise HTTPException(status_code=404, detail="Provider not supported")
 
     if not _google_oauth_configured():
-        return HTMLResponse(
-            _build_error_page("Google OAuth is not configured. Please set GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET."),
-            status_code=503,
-        )
+        return HTMLResponse(_NOT_CONFIGURED_PAGE, status_code=503)
 
-    state = secrets.token_urlsafe(16)
     redirect_uri = _google_redirect_uri(request)
     _ = next
-    _pending_oauth_states[state] = {"provider": provider, "next": FREELANCER_INTAKE_PATH, "redirect_uri": redirect_uri}
-
-    params = {
-        "client_id": os.environ["GOOGLE_CLIENT_ID"],
-        "redirect_uri": redirect_uri,
-        "response_type": "code",
-        "scope": "openid email profile",
-        "state": state,
-        "access_type": "online",
-        "include_granted_scopes": "true",
-    }
-    return RedirectResponse("https://accounts.google.com/o/oauth2/v2/auth?" + urllib.parse.urlencode(params))
+    state = _encode_oauth_state(_pending_login(provider, redirect_uri))
+
+    auth_template = _google_auth_template(os.environ["GOOGLE_CLIENT_ID"])
+    return RedirectResponse(auth_template.format(redir=urllib.parse.quote(redirect_uri, safe=""), state=state))
 
 
 @auth_router.get("/callback/{provider}", response_class=HTMLResponse)
-def oauth_callback(request: Request, provider: str, state: str = "", code: str = "", error: str = ""):
+async def oauth_callback(request: Request, provider: str, state: str = "", code: str = "", error: str = ""):
     provider = provider.lower()
-    pending = _pending_oauth_states.pop(state, None)
-    if provider != "google":
+    pending = _decode_oauth_state(state)
+    if provider not in _SUPPORTED_PROVIDERS:
         raise HTTPException(status_code=400, detail="Invalid OAuth callback")
     if not pending:
-        pending = {"provider": provider, "next": FREELANCER_INTAKE_PATH, "redirect_uri": _google_redirect_uri(request)}
+        pending = _pending_login(provider, _google_redirect_uri(request))
 
     if error:
         return HTMLResponse(_build_error_page(f"Provider returned error: {error}"), status_code=400)
 
     if not _google_oauth_configured():
-        return HTMLResponse(
-            _build_error_page("Google OAuth is not configured. Please set GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET."),
-            status_code=503,
-        )
+        return HTMLResponse(_NOT_CONFIGURED_PAGE, status_code=503)
 
     if not code:
         return HTMLResponse(_build_error_page("Missing authorization code from Google callback."), status_code=400)
 
     try:
-        token_payload = _exchange_google_code_for_token(code, pending["redirect_uri"])
+        token_payload = await _exchange_google_code_for_token(code, pending["redirect_uri"])
         access_token = token_payload.get("access_token", "")
         if not access_token:
             return HTMLResponse(_build_error_page("Google token exchange failed: no access token."), status_code=400)
-        profile = _fetch_google_user_info(access_token)
+        profile = await _resolve_google_profile(access_token, token_payload)
         resolved_name = profile.get("name", "Google User")
         resolved_email = profile.get("email", "user@google.login")
     except Exception as exc:  # pragma: no cover
         return HTMLResponse(_build_error_page(f"Google sign-in failed: {exc}"), status_code=400)
 
-    session_token = secrets.token_urlsafe(24)
-    _user_sessions[session_token] = {"name": resolved_name, "email": resolved_email, "provider": provider}
+    session_token = _new_token(24)
+    session_user = {"name": resolved_name, "email": resolved_email, "provider": provider}
+    if profile.get("provenance") == "stale":
+        session_user["provenance"] = "stale"
+    await run_in_threadpool(_save_session, session_token, session_user)
 
     response = RedirectResponse(pending["next"], status_code=302)
     response.set_cookie(AUTH_COOKIE, session_token, httponly=True, samesite="lax")
@@ -324,12 +576,15 @@ def oauth_callback(request: Request, provider: str, state: str = "", code: str =
 
 
 @auth_router.get("/{provider}/callback", response_class=HTMLResponse)
-def oauth_callback_compat(request: Request, provider: str, state: str = "", code: str = "", error: str = ""):
-    return oauth_callback(request=request, provider=provider, state=state, code=code, error=error)
+async def oauth_callback_compat(request: Request, provider: str, state: str = "", code: str = "", error: str = ""):
+    return await oauth_callback(request=request, provider=provider, state=state, code=code, error=error)
 
 
 @auth_router.get("/logout")
-def logout() -> RedirectResponse:
+def logout(request: Request) -> RedirectResponse:
+    token = request.cookies.get(AUTH_COOKIE)
+    if token:
+        _delete_session(token)
     response = RedirectResponse("/ui", status_code=302)
     response.delete_cookie(AUTH_COOKIE)
     return response
@@ -96,6 +96,15 @@ def upsert_freelancer_record(
         connection.commit()
 
 
+def update_freelancer_embedding(resume_id: str, embedding: List[float]) -> None:
+    with _get_connection() as connection:
+        connection.execute(
+            "UPDATE freelancers SET embedding_json = ?, updated_at = datetime('now') WHERE resume_id = ?",
+            (json.dumps(embedding), resume_id),
+        )
+        connection.commit()
+
+
 def load_freelancer_records() -> List[Dict[str, Any]]:
     with _get_connection() as connection:
         rows = connection.execute(
@@ -1,35 +1,133 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+import hashlib
+import os
+import re
+import subprocess
+from typing import AsyncIterator, Dict, Iterable
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, RedirectResponse, Response, StreamingResponse
+from jinja2 import DictLoader, Environment, select_autoescape
 
 from auth import get_authenticated_user
+from static_pages import StaticPage
 
-ui_router = APIRouter(tags=["ui"])
+# Browser pages, not API: kept out of the OpenAPI schema and /docs.
+ui_router = APIRouter(tags=["ui"], include_in_schema=False)
 
 
-@ui_router.get("/ui", response_class=HTMLResponse)
-def landing_page() -> str:
-    return """
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-      <meta charset="UTF-8" />
-      <meta name="viewport" content="width=device-width, initial-scale=1.0" />
-      <title>Freelancing AI Portal</title>
-      <style>
+# Stylesheet URLs carry a hash of their content, so a given URL never changes and may be cached for good.
+STYLESHEET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+# Each page's styles are served as an external stylesheet, so browsers cache them instead of receiving them
+# inline with every page view. Pages carry a marker comment where the <link> tag goes.
+_STYLESHEET_MARKER = "<!-- stylesheet -->"
+_STYLESHEETS: Dict[str, StaticPage] = {}
+
+
+def _with_stylesheet(page: str, name: str, css: str) -> str:
+    body = css.encode("utf-8")
+    filename = f"{name}.{hashlib.md5(body, usedforsecurity=False).hexdigest()[:12]}.css"
+    _STYLESHEETS[filename] = StaticPage(body, media_type="text/css", cache_control=STYLESHEET_CACHE_CONTROL)
+    return page.replace(_STYLESHEET_MARKER, f'<link rel="stylesheet" href="/ui/styles/{filename}" />')
+
+
+# Inline scripts are minified once at import unless DEBUG is set. String and template literals are copied
+# through untouched, so only code between them is squeezed. The pages' scripts contain no regex literals.
+_JS_LITERAL_RE = re.compile(
+    r"""(?P<literal>'(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*"|`(?:\\.|[^`\\])*`)|(?P<comment>//[^\n]*|/\*.*?\*/)""",
+    re.S,
+)
+# Spaces and tabs next to these can go; line breaks stay. "+" and "-" are left out so "a + +b" never becomes "a++b".
+_JS_PUNCT_SPACE_RE = re.compile(r"[ \t]*([{}()\[\];,:=<>!&|?*])[ \t]*")
+_SCRIPT_RE = re.compile(r"(<script>)(.*?)(</script>)", re.S)
+
+
+def _minify_js_code(code: str) -> str:
+    # Runs that span a line break keep one, and the punctuation pass only eats spaces and tabs, so automatic
+    # semicolon insertion still sees the same statements ("}\nconst", "return\n{").
+    code = re.sub(r"\s+", lambda match: "\n" if "\n" in match.group() else " ", code)
+    return _JS_PUNCT_SPACE_RE.sub(r"\1", code)
+
+
+def _minify_js(source: str) -> str:
+    out = []
+    code = []
+    position = 0
+    for match in _JS_LITERAL_RE.finditer(source):
+        code.append(source[position : match.start()])
+        if match.group("literal"):
+            out.append(_minify_js_code("".join(code)))
+            out.append(match.group("literal"))
+            code = []
+        else:
+            # A dropped comment still separates tokens, like the whitespace around it.
+            code.append(" ")
+        position = match.end()
+    code.append(source[position:])
+    out.append(_minify_js_code("".join(code)))
+    return "".join(out).strip()
+
+
+def _minify_scripts(page: str) -> str:
+    if os.getenv("DEBUG"):
+        return page
+    return _SCRIPT_RE.sub(lambda match: match.group(1) + _minify_js(match.group(2)) + match.group(3), page)
+
+
+@ui_router.get("/ui/styles/{filename}")
+async def stylesheet(filename: str, request: Request) -> Response:
+    sheet = _STYLESHEETS.get(filename)
+    if sheet is None:
+        raise HTTPException(status_code=404, detail="Stylesheet not found")
+    return sheet.response(request)
+
+
+# Rules every page shares, spliced in front of each page's own stylesheet so the three stay in step.
+_SHARED_CSS = """
         :root {
           --bg:#f8f5ff;
           --surface:#ffffff;
-          --surface-alt:#f1eafe;
           --text:#1e1534;
           --muted:#6b5a8e;
           --brand:#6d28d9;
           --brand-strong:#5b21b6;
+        }
+        * { box-sizing:border-box; }
+"""
+
+# Palette and controls shared by the two form pages (resume intake and job posting).
+_FORM_CSS = """
+        :root {
+          --surface-soft:#f5f0ff;
+          --success:#0f9d58;
+          --warning:#b45309;
+          --border:#ddcdfb;
+        }
+        body { margin:0; font-family: Inter, system-ui, sans-serif; background:var(--bg); color:var(--text); }
+        .container { max-width:1080px; margin:0 auto; padding:1.4rem 1rem 3rem; }
+        .brand span { color:var(--brand); }
+        input, textarea {
+          width:100%; border-radius:10px; border:1px solid #ccb8f8; background:var(--surface-soft);
+          color:var(--text); padding:.7rem .8rem; margin:.35rem 0 .9rem; font-size:.95rem;
+        }
+        label { font-weight:700; font-size:.9rem; }
+        button {
+          width:100%; border:none; border-radius:12px; color:#fff; font-weight:800; padding:.8rem;
+          background:linear-gradient(100deg,var(--brand), var(--brand-strong)); cursor:pointer;
+        }
+        .success { color:var(--success); } .warning { color:var(--warning); }
+"""
+
+_LANDING_CSS = """
+        :root {
+          --surface-alt:#f1eafe;
           --accent:#f97316;
           --border:#dfd1fb;
         }
-        * { box-sizing:border-box; }
         body {
           margin:0;
           font-family: Inter, system-ui, -apple-system, sans-serif;
@@ -104,7 +202,17 @@ def landing_page() -> str:
           background:#fff;
         }
         .stat b { font-size:1.25rem; display:block; color:var(--brand-strong); }
-      </style>
+"""
+
+# Static pages are encoded once at import; handlers hand the same bytes to every response.
+_LANDING_HTML = """
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+      <meta charset="UTF-8" />
+      <meta name="viewport" content="width=device-width, initial-scale=1.0" />
+      <title>Freelancing AI Portal</title>
+      <!-- stylesheet -->
     </head>
     <body>
       <div class="container">
@@ -131,68 +239,42 @@ def landing_page() -> str:
     </body>
     </html>
     """
+_LANDING_PAGE = StaticPage(_with_stylesheet(_LANDING_HTML, "landing", _SHARED_CSS + _LANDING_CSS).encode("utf-8"))
 
 
-@ui_router.get("/ui/resume", response_class=HTMLResponse)
-def resume_page(request: Request):
-    user = get_authenticated_user(request)
-    if not user:
-        return RedirectResponse("/auth/start/google?next=/ui/resume", status_code=302)
+@ui_router.get("/ui", response_class=HTMLResponse)
+async def landing_page(request: Request) -> Response:
+    return _LANDING_PAGE.response(request)
 
-    user_name = user.get("name", "")
-    user_email = user.get("email", "")
-    provider = user.get("provider", "provider")
 
-    return f"""
+_RESUME_CSS = """
+        .topbar { display:flex; justify-content:space-between; align-items:center; margin-bottom:1rem; }
+        .brand { font-size:1.05rem; font-weight:800; }
+        .layout { display:grid; grid-template-columns:320px 1fr; gap:1rem; }
+        .panel, .card { background:var(--surface); border:1px solid var(--border); border-radius:18px; }
+        .panel { padding:1.1rem; }
+        .panel p { color:var(--muted); line-height:1.45; }
+        .card { padding:1.3rem; box-shadow:0 14px 24px rgba(109,40,217,.08); }
+        .message { min-height:1.1rem; margin-top:.55rem; font-weight:600; }
+        @media (max-width:900px) { .layout { grid-template-columns:1fr; } }
+"""
+
+# The resume page is static apart from three fields. It is parsed once at import; autoescaping covers the
+# HTML uses and tojson the ones inside the script, so user-supplied names can't break out of either.
+_RESUME_TEMPLATE = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
       <meta charset="UTF-8" />
       <meta name="viewport" content="width=device-width, initial-scale=1.0" />
       <title>Freelancer Profile Intake</title>
-      <style>
-        :root {{
-          --bg:#f8f5ff;
-          --surface:#ffffff;
-          --surface-soft:#f5f0ff;
-          --text:#1e1534;
-          --muted:#6b5a8e;
-          --brand:#6d28d9;
-          --brand-strong:#5b21b6;
-          --success:#0f9d58;
-          --warning:#b45309;
-          --border:#ddcdfb;
-        }}
-        * {{ box-sizing:border-box; }}
-        body {{ margin:0; font-family: Inter, system-ui, sans-serif; background:var(--bg); color:var(--text); }}
-        .container {{ max-width:1080px; margin:0 auto; padding:1.4rem 1rem 3rem; }}
-        .topbar {{ display:flex; justify-content:space-between; align-items:center; margin-bottom:1rem; }}
-        .brand {{ font-size:1.05rem; font-weight:800; }}
-        .brand span {{ color:var(--brand); }}
-        .layout {{ display:grid; grid-template-columns:320px 1fr; gap:1rem; }}
-        .panel, .card {{ background:var(--surface); border:1px solid var(--border); border-radius:18px; }}
-        .panel {{ padding:1.1rem; }}
-        .panel p {{ color:var(--muted); line-height:1.45; }}
-        .card {{ padding:1.3rem; box-shadow:0 14px 24px rgba(109,40,217,.08); }}
-        input, textarea {{
-          width:100%; border-radius:10px; border:1px solid #ccb8f8; background:var(--surface-soft);
-          color:var(--text); padding:.7rem .8rem; margin:.35rem 0 .9rem; font-size:.95rem;
-        }}
-        label {{ font-weight:700; font-size:.9rem; }}
-        button {{
-          width:100%; border:none; border-radius:12px; color:#fff; font-weight:800; padding:.8rem;
-          background:linear-gradient(100deg,var(--brand), var(--brand-strong)); cursor:pointer;
-        }}
-        .message {{ min-height:1.1rem; margin-top:.55rem; font-weight:600; }}
-        .success {{ color:var(--success); }} .warning {{ color:var(--warning); }}
-        @media (max-width:900px) {{ .layout {{ grid-template-columns:1fr; }} }}
-      </style>
+      <!-- stylesheet -->
     </head>
     <body>
       <main class="container">
         <div class="topbar">
           <div class="brand"><span>Freelancing</span>AI</div>
-          <small>Signed in via {provider.title()} </small>
+          <small>Signed in via {{ provider }} </small>
         </div>
         <section class="layout">
           <aside class="panel">
@@ -208,10 +290,10 @@ def resume_page(request: Request):
             <h1 style="margin-top:0">Freelancer onboarding</h1>
             <form id="freelancerForm">
               <label for="name">Full name</label>
-              <input id="name" name="name" value="{user_name}" required />
+              <input id="name" name="name" value="{{ name }}" required />
 
               <label for="email">Email</label>
-              <input id="email" name="email" type="email" value="{user_email}" required />
+              <input id="email" name="email" type="email" value="{{ email }}" required />
 
               <label for="headline">Role / Headline</label>
               <input id="headline" name="headline" placeholder="Senior Backend Engineer" required />
@@ -236,7 +318,7 @@ def resume_page(request: Request):
       </main>
       <script>
         const registerMessage = document.getElementById('registerMessage');
-        document.getElementById('freelancerForm').addEventListener('submit', async (event) => {{
+        document.getElementById('freelancerForm').addEventListener('submit', async (event) => {
           event.preventDefault();
           registerMessage.className = 'message';
           registerMessage.textContent = 'Uploading...';
@@ -249,69 +331,92 @@ def resume_page(request: Request):
           formData.append('skills', formElement.skills.value);
           formData.append('bio', formElement.bio.value);
           formData.append('file', formElement.resume.files[0]);
-          try {{
-            const response = await fetch('/freelancers/register', {{ method:'POST', body:formData }});
+          try {
+            const response = await fetch('/freelancers/register', { method:'POST', body:formData });
             const data = await response.json();
             if (!response.ok) throw new Error(data.detail || 'Failed to upload resume.');
             registerMessage.className = 'message success';
-            registerMessage.textContent = `Registered ${{data.profile.name}} (ID: ${{data.resume_id}})`;
+            registerMessage.textContent = `Registered ${data.profile.name} (ID: ${data.resume_id})`;
             formElement.reset();
-            formElement.name.value = '{user_name}';
-            formElement.email.value = '{user_email}';
-          }} catch (error) {{
+            formElement.name.value = {{ name|tojson }};
+            formElement.email.value = {{ email|tojson }};
+          } catch (error) {
             registerMessage.className = 'message warning';
             registerMessage.textContent = error.message;
-          }}
-        }});
+          }
+        });
       </script>
     </body>
     </html>
     """
+_TEMPLATES = Environment(
+    loader=DictLoader(
+        {
+            "resume.html": _minify_scripts(
+                _with_stylesheet(_RESUME_TEMPLATE, "resume", _SHARED_CSS + _FORM_CSS + _RESUME_CSS)
+            )
+        }
+    ),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=False,
+)
+_RESUME_PAGE = _TEMPLATES.get_template("resume.html")
+# Smallest chunk sent while streaming; Jinja yields one piece per template node, most far smaller than a packet.
+STREAM_CHUNK_BYTES = 1024
 
 
-@ui_router.get("/ui/jobs", response_class=HTMLResponse)
-def jobs_page() -> str:
-    return """
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-      <meta charset="UTF-8" />
-      <meta name="viewport" content="width=device-width, initial-scale=1.0" />
-      <title>Client Job Posting</title>
-      <style>
-        :root {
-          --bg:#f8f5ff;
-          --surface:#ffffff;
-          --surface-soft:#f5f0ff;
-          --text:#1e1534;
-          --muted:#6b5a8e;
-          --brand:#6d28d9;
-          --brand-strong:#5b21b6;
-          --success:#0f9d58;
-          --warning:#b45309;
-          --border:#ddcdfb;
-        }
-        * { box-sizing:border-box; }
-        body { margin:0; font-family: Inter, system-ui, sans-serif; background:var(--bg); color:var(--text); }
-        .container { max-width:1080px; margin:0 auto; padding:1.4rem 1rem 3rem; }
+async def _coalesced(pieces: Iterable[str]) -> AsyncIterator[bytes]:
+    # Rendering is pure CPU, so the pieces are pulled on the loop rather than one threadpool hop per chunk.
+    buffer = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= STREAM_CHUNK_BYTES:
+            yield "".join(buffer).encode("utf-8")
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
+# Display names for sign-in providers; str.title() would render "Github" and "Linkedin".
+_PROVIDER_TITLES = {"google": "Google", "github": "GitHub", "microsoft": "Microsoft", "linkedin": "LinkedIn"}
+
+
+@ui_router.get("/ui/resume", response_class=HTMLResponse)
+async def resume_page(request: Request):
+    # The lookup can block on Redis, so only it goes to the threadpool; rendering stays on the loop.
+    user = await run_in_threadpool(get_authenticated_user, request)
+    if not user:
+        return RedirectResponse("/auth/start/google?next=/ui/resume", status_code=302)
+
+    provider = user.get("provider", "provider")
+    # Streamed so the browser can start on the <head> and its styles while the form body is still rendering.
+    pieces = _RESUME_PAGE.generate(
+        name=user.get("name", ""),
+        email=user.get("email", ""),
+        provider=_PROVIDER_TITLES.get(provider) or provider.title(),
+    )
+    return StreamingResponse(_coalesced(pieces), media_type="text/html")
+
+
+_JOBS_CSS = """
         .brand { font-size:1.05rem; font-weight:800; margin-bottom:1rem; }
-        .brand span { color:var(--brand); }
         .card { background:var(--surface); border:1px solid var(--border); border-radius:18px; padding:1.3rem; box-shadow:0 14px 24px rgba(109,40,217,.08); }
-        input, textarea {
-          width:100%; border-radius:10px; border:1px solid #ccb8f8; background:var(--surface-soft);
-          color:var(--text); padding:.7rem .8rem; margin:.35rem 0 .9rem; font-size:.95rem;
-        }
-        label { font-weight:700; font-size:.9rem; }
-        button {
-          width:100%; border:none; border-radius:12px; color:#fff; font-weight:800; padding:.8rem;
-          background:linear-gradient(100deg,var(--brand), var(--brand-strong)); cursor:pointer;
-        }
         .message { font-size:.9rem; min-height:1.1rem; margin-top:.5rem; font-weight:600; }
-        .success { color:var(--success); } .warning { color:var(--warning); }
         table { width:100%; border-collapse:collapse; margin-top:.95rem; font-size:.92rem; border:1px solid var(--border); border-radius:10px; overflow:hidden; }
         th, td { border-bottom:1px solid #e5dafc; text-align:left; padding:.58rem; }
         thead { background:#f0e8ff; }
-      </style>
+"""
+
+_JOBS_HTML = """
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+      <meta charset="UTF-8" />
+      <meta name="viewport" content="width=device-width, initial-scale=1.0" />
+      <title>Client Job Posting</title>
+      <!-- stylesheet -->
     </head>
     <body>
       <main class="container">
@@ -355,10 +460,8 @@ def jobs_page() -> str:
             if (!response.ok) throw new Error(data.detail || 'Job matching failed.');
             jobMessage.className = 'message success';
             jobMessage.textContent = `Found ${data.top_matches.length} top matches.`;
-            const rows = data.top_matches.map((m) => `
-              <tr><td>${m.name}</td><td>${m.headline}</td><td>${m.final_score}</td><td>${m.skill_score}</td><td>${m.experience_score}</td></tr>
-            `).join('');
-            resultsContainer.innerHTML = `<table><thead><tr><th>Name</th><th>Headline</th><th>Final Score</th><th>Skill</th><th>Experience</th></tr></thead><tbody>${rows || '<tr><td colspan="5">No results.</td></tr>'}</tbody></table>`;
+            // rows_html is rendered and escaped by the server.
+            resultsContainer.innerHTML = `<table><thead><tr><th>Name</th><th>Headline</th><th>Final Score</th><th>Skill</th><th>Experience</th></tr></thead><tbody>${data.rows_html || '<tr><td colspan="5">No results.</td></tr>'}</tbody></table>`;
           } catch (error) {
             jobMessage.className = 'message warning';
             jobMessage.textContent = error.message;
@@ -368,3 +471,30 @@ def jobs_page() -> str:
     </body>
     </html>
     """
+_JOBS_PAGE = StaticPage(
+    _minify_scripts(_with_stylesheet(_JOBS_HTML, "jobs", _SHARED_CSS + _FORM_CSS + _JOBS_CSS)).encode("utf-8")
+)
+
+
+@ui_router.get("/ui/jobs", response_class=HTMLResponse)
+async def jobs_page(request: Request) -> Response:
+    return _JOBS_PAGE.response(request)
+
+
+# Template placeholders inside scripts; stood in for by a literal so the minified code can be syntax-checked.
+_TEMPLATE_EXPR_RE = re.compile(r"{{.*?}}")
+
+
+def check_minified_scripts() -> None:
+    """Run every minified inline script through ``node --check``; raises if one no longer parses."""
+    for name, page in (("resume", _RESUME_TEMPLATE), ("jobs", _JOBS_HTML)):
+        for match in _SCRIPT_RE.finditer(page):
+            script = _TEMPLATE_EXPR_RE.sub("null", _minify_js(match.group(2)))
+            result = subprocess.run(["node", "--check", "-"], input=script, capture_output=True, text=True)
+            if result.returncode != 0:
+                raise RuntimeError(f"Minified {name} page script does not parse:\n{result.stderr}")
+
+
+if __name__ == "__main__":
+    check_minified_scripts()
+    print("Minified inline scripts parse.")
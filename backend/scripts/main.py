@@ -1,12 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import base64
+import codecs
+import functools
 import hashlib
+import html
 import io
+import itertools
+import logging
+import os
 import re
-import uuid
-from typing import Dict, List, Tuple
-
-from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+from cachetools import LRUCache
+from fastapi import BackgroundTasks, FastAPI, File, Form, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from pydantic import BaseModel, Field
 
 from auth import auth_router
@@ -14,15 +26,29 @@ from database import (
     init_db,
     list_freelancer_profiles,
     load_freelancer_records,
+    update_freelancer_embedding,
     upsert_freelancer_record,
 )
-from ui_routes import ui_router
+from ui_routes import mount_frontend_assets
+
+# UI_MODE=inline serves the original server-rendered pages instead of the React build. Only one of the two
+# routers is ever registered, so /ui and its subpaths have a single owner per process.
+UI_MODE = os.getenv("UI_MODE", "react").lower()
+if UI_MODE == "inline":
+    from inline_ui_routes import ui_router
+else:
+    from ui_routes import ui_router
 
 try:
     from sentence_transformers import SentenceTransformer
 except ImportError:  # pragma: no cover
     SentenceTransformer = None
 
+try:
+    import torch
+except ImportError:  # pragma: no cover
+    torch = None
+
 try:
     from pypdf import PdfReader
 except ImportError:  # pragma: no cover
@@ -33,29 +59,296 @@ try:
 except ImportError:  # pragma: no cover
     Document = None
 
+try:
+    import simsimd
+except ImportError:  # pragma: no cover
+    simsimd = None
+
+try:
+    from usearch.index import Index as USearchIndex
+except ImportError:  # pragma: no cover
+    USearchIndex = None
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import numba
+except ImportError:  # pragma: no cover
+    numba = None
+
 
-app = FastAPI(title="Freelancing AI Matching API")
+logger = logging.getLogger(__name__)
+
+# orjson encodes straight to bytes; ORJSONResponse imports fine without it but fails at render time.
+JSON_RESPONSE_CLASS = ORJSONResponse if orjson is not None else JSONResponse
+
+app = FastAPI(title="Freelancing AI Matching API", default_response_class=JSON_RESPONSE_CLASS)
 app.include_router(auth_router)
+if UI_MODE != "inline":
+    # Mounted ahead of ui_router so /ui/assets/* never reaches the /ui/{path} catch-all.
+    mount_frontend_assets(app)
 app.include_router(ui_router)
 
 
+# BINARY_PREFILTER=1 (with simsimd installed) makes query() shortlist candidates by Hamming distance over sign
+# bits before the exact rerank, once there are BINARY_PREFILTER_MIN_ROWS rows. It is off by default because
+# it is lossy: a 4 x n_results shortlist measured recall@10 of 0.56 on 20k x 384 clustered vectors and 0.3
+# on 6k x 64 random ones. Measure recall on your own data before enabling it or lowering the factor.
+BINARY_PREFILTER = os.getenv("BINARY_PREFILTER") == "1" and simsimd is not None
+BINARY_PREFILTER_MIN_ROWS = 4096
+BINARY_SHORTLIST_FACTOR = int(os.getenv("BINARY_SHORTLIST_FACTOR", "32"))
+# Above this many rows (and with usearch installed) query() searches an HNSW graph instead of scanning.
+# The exact GEMV is ~1.3 ms at 20k x 384, so the graph only pays for its build time and second copy of the
+# matrix once a scan takes tens of milliseconds.
+HNSW_MIN_ROWS = 250_000
+HNSW_EXPANSION_SEARCH = 64
+
+
+INITIAL_COLLECTION_CAPACITY = 64
+# EMBEDDING_STORAGE_DTYPE=float16 halves collection memory and the bytes every scan reads, int8 quarters it
+# (with one float32 scale per row); scores stay float32 either way.
+_STORAGE_DTYPES = {"float32": np.float32, "float16": np.float16, "int8": np.int8}
+EMBEDDING_STORAGE_DTYPE = _STORAGE_DTYPES.get(os.getenv("EMBEDDING_STORAGE_DTYPE", "float32").lower(), np.float32)
+# Reduced-precision rows are widened to fp32 this many at a time on the NumPy path, bounding the temporary copy.
+SCORE_BLOCK_ROWS = 8192
+
+
 class InMemoryCollection:
     """A tiny in-memory substitute for vector DB behaviour."""
 
-    def __init__(self) -> None:
-        self._rows: List[Dict] = []
+    def __init__(self, dtype: type = np.float32) -> None:
+        self._dtype = np.dtype(dtype)
+        # Struct-of-arrays: row i is (_ids[i], _documents[i], _matrix[i]).
+        self._ids: List[str] = []
+        self._documents: List[str] = []
+        # (capacity, D) buffer of unit-length rows, doubled when full; only the first len(self) are live.
+        self._matrix: Optional[np.ndarray] = None
+        # int8 storage only: per-row factor that maps the stored codes back to the unit vector.
+        self._scales: Optional[np.ndarray] = None
+        # BINARY_PREFILTER only: one sign bit per coordinate, packed to (capacity, ceil(D / 8)) bytes and
+        # filled in by add() alongside _matrix.
+        self._binary: Optional[np.ndarray] = None
+        # HNSW graph keyed by row position. add() starts a background build once past HNSW_MIN_ROWS and extends
+        # the graph after it is published; until then query() keeps scanning.
+        self._index = None
+        self._index_building = False
+        self._index_lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, documents: List[str], embeddings: List[np.ndarray], ids: List[str]) -> None:
+        rows = list(zip(documents, embeddings, ids))
+        if not rows:
+            return
+
+        # Normalized once here, so every query is a plain dot product against the stored rows.
+        vectors = _normalize_rows(np.vstack([np.asarray(emb, dtype=np.float32) for _, emb, _ in rows]))
+        with self._index_lock:
+            start = len(self)
+            end = start + len(rows)
+            self._reserve(end, vectors.shape[1])
+            if self._scales is not None:
+                self._matrix[start:end], self._scales[start:end] = _quantize_int8(vectors)
+            else:
+                self._matrix[start:end] = vectors
+            if self._binary is not None:
+                self._binary[start:end] = np.packbits(vectors > 0, axis=1)
+            self._documents.extend(doc for doc, _, _ in rows)
+            self._ids.extend(item_id for _, _, item_id in rows)
+            if self._index is not None:
+                self._index.add(np.arange(start, end), vectors)
+            elif USearchIndex is not None and end >= HNSW_MIN_ROWS and not self._index_building:
+                # Building the graph takes seconds at this size, so it must never run on the event loop.
+                self._index_building = True
+                threading.Thread(target=self._build_index, name="hnsw-build", daemon=True).start()
+
+    def _reserve(self, needed: int, dimension: int) -> None:
+        if self._matrix is not None and needed <= self._matrix.shape[0]:
+            return
+        capacity = INITIAL_COLLECTION_CAPACITY if self._matrix is None else self._matrix.shape[0]
+        while capacity < needed:
+            capacity *= 2
+        matrix = np.empty((capacity, dimension), dtype=self._dtype)
+        scales = np.empty(capacity, dtype=np.float32) if self._dtype == np.int8 else None
+        binary = np.empty((capacity, -(-dimension // 8)), dtype=np.uint8) if BINARY_PREFILTER else None
+        if self._matrix is not None:
+            matrix[: len(self)] = self._matrix[: len(self)]
+            if scales is not None:
+                scales[: len(self)] = self._scales[: len(self)]
+            if binary is not None:
+                binary[: len(self)] = self._binary[: len(self)]
+        self._matrix, self._scales, self._binary = matrix, scales, binary
+
+    def _binary_candidates(self, query_vector: np.ndarray, binary: np.ndarray, n_results: int) -> Optional[np.ndarray]:
+        shortlist = BINARY_SHORTLIST_FACTOR * n_results
+        if not BINARY_PREFILTER or binary.shape[0] < BINARY_PREFILTER_MIN_ROWS or shortlist >= binary.shape[0]:
+            return None
+        distances = _hamming_distances(np.packbits(query_vector > 0), binary)
+        return np.argpartition(distances, shortlist - 1)[:shortlist]
+
+    def query(self, query_embedding: np.ndarray, n_results: int = 5) -> Tuple[List[str], np.ndarray]:
+        """Return the ids of the ``n_results`` nearest rows and their cosine scores, best first.
+
+        Safe to call from a worker thread while add() runs on the event loop: the scan reads a snapshot of the
+        first N rows, which later inserts never modify.
+        """
+        if n_results <= 0:
+            return [], np.empty(0, dtype=np.float32)
+
+        query_vector = _normalize_rows(np.asarray(query_embedding, dtype=np.float32))
+        with self._index_lock:
+            size = len(self)
+            if not size:
+                return [], np.empty(0, dtype=np.float32)
+            if self._index is not None and query_vector.any():
+                # Graph search is sub-millisecond; holding the lock keeps it from racing add()'s inserts.
+                matches = self._index.search(query_vector, n_results)
+                return [self._ids[key] for key in matches.keys.tolist()], 1.0 - matches.distances.astype(np.float32)
+            ids = self._ids
+            matrix = self._matrix[:size]
+            scales = None if self._scales is None else self._scales[:size]
+            binary = None if self._binary is None else self._binary[:size]
+
+        candidates = None if binary is None else self._binary_candidates(query_vector, binary, n_results)
+        if candidates is not None:
+            matrix = matrix[candidates]
+            scales = None if scales is None else scales[candidates]
+
+        scores = _cosine_scores(query_vector, matrix) if scales is None else _int8_scores(query_vector, matrix, scales)
+        top = _top_k_indices(scores, n_results)
+        rows = top if candidates is None else candidates[top]
+        return [ids[row] for row in rows.tolist()], scores[top]
+
+    @staticmethod
+    def _index_rows(matrix: np.ndarray, scales: Optional[np.ndarray], start: int, end: int) -> np.ndarray:
+        rows = matrix[start:end]
+        return rows if scales is None else rows * scales[start:end, np.newaxis]
+
+    def _build_index(self) -> None:
+        # Rows below `built` never change and a regrown buffer copies them, so this snapshot is safe to read
+        # without the lock while add() keeps appending.
+        with self._index_lock:
+            built, matrix, scales = len(self), self._matrix, self._scales
+        index = USearchIndex(
+            ndim=matrix.shape[1],
+            # usearch's i8 inner product is not rescaled to [-1, 1]; cosine is, and equals ip for unit rows.
+            metric="cos" if self._dtype == np.int8 else "ip",
+            dtype={np.dtype(np.float16): "f16", np.dtype(np.int8): "i8"}.get(self._dtype, "f32"),
+            expansion_search=HNSW_EXPANSION_SEARCH,
+        )
+        index.add(np.arange(built), self._index_rows(matrix, scales, 0, built))
+        with self._index_lock:
+            # Catch up on rows added while the graph was being built, then publish it.
+            if len(self) > built:
+                index.add(np.arange(built, len(self)), self._index_rows(self._matrix, self._scales, built, len(self)))
+            self._index = index
+
+
+def _quantize_int8(vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-row int8 codes plus the float32 factor that dequantizes them."""
+    peaks = np.abs(vectors).max(axis=-1, keepdims=True)
+    scales = np.divide(np.float32(127.0), peaks, out=np.ones_like(peaks), where=peaks > 0)
+    return np.rint(vectors * scales).astype(np.int8), (1.0 / scales).squeeze(-1)
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    # Zero vectors stay zero, so they score 0 against everything.
+    return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+
+# Each scorer takes a unit query and unit rows, so the cosine is just the dot product.
+def _numpy_cosine_scores(query_vector: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    if matrix.dtype == np.float32:
+        # One GEMV over the whole corpus instead of a Python-level loop per row.
+        return matrix @ query_vector
+    # NumPy has no half-precision BLAS, so widen fp16 rows block by block and keep the GEMV in fp32.
+    scores = np.empty(matrix.shape[0], dtype=np.float32)
+    for start in range(0, matrix.shape[0], SCORE_BLOCK_ROWS):
+        block = matrix[start : start + SCORE_BLOCK_ROWS]
+        scores[start : start + block.shape[0]] = block.astype(np.float32) @ query_vector
+    return scores
+
+
+def _simsimd_cosine_scores(query_vector: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    if not query_vector.any():
+        return np.zeros(matrix.shape[0], dtype=np.float32)
+    # SimSIMD picks the widest available SIMD kernel at runtime; rows are unit length, so "dot" is the cosine.
+    # fp16 rows are read natively; the query is cast to match.
+    query = query_vector.astype(matrix.dtype, copy=False)[np.newaxis]
+    return np.asarray(simsimd.cdist(query, matrix, metric="dot", out_dtype="float32"))[0]
+
+
+def _numpy_int8_scores(query_vector: np.ndarray, codes: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    return _numpy_cosine_scores(query_vector, codes) * scales
+
+
+def _simsimd_int8_scores(query_vector: np.ndarray, codes: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    # Quantize the query the same way so SimSIMD can run its int8 dot kernel (VNNI where available).
+    query_codes, query_scale = _quantize_int8(query_vector)
+    dots = np.asarray(simsimd.cdist(query_codes[np.newaxis], codes, metric="dot", out_dtype="float32"))[0]
+    return dots * scales * query_scale
+
+
+_int8_scores = _simsimd_int8_scores if simsimd is not None else _numpy_int8_scores
+
+
+def _numpy_has_blas() -> bool:
+    try:
+        return bool(np.show_config(mode="dicts")["Build Dependencies"]["blas"]["found"])
+    except (KeyError, TypeError):
+        # NumPy < 1.26 has no dict config; every wheel of those versions bundles OpenBLAS.
+        return True
+
+
+if numba is not None:
+
+    @numba.njit(cache=True, fastmath=True, boundscheck=False)
+    def _numba_row_dots(query_vector: np.ndarray, matrix: np.ndarray, out: np.ndarray) -> None:
+        for i in range(matrix.shape[0]):
+            total = np.float32(0.0)
+            for j in range(matrix.shape[1]):
+                total += query_vector[j] * matrix[i, j]
+            out[i] = total
+
+
+def _numba_cosine_scores(query_vector: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    if matrix.dtype != np.float32:
+        # Numba's float16 support does not cover this loop; use the blocked NumPy path.
+        return _numpy_cosine_scores(query_vector, matrix)
+    dots = np.empty(matrix.shape[0], dtype=np.float32)
+    _numba_row_dots(query_vector, matrix, dots)
+    return dots
+
+
+if simsimd is not None:
+    _cosine_scores = _simsimd_cosine_scores
+elif numba is not None and not _numpy_has_blas():
+    # Without BLAS, matrix @ vector is NumPy's naive loop; the JIT kernel vectorizes with FMA instead.
+    _cosine_scores = _numba_cosine_scores
+else:
+    _cosine_scores = _numpy_cosine_scores
 
-    def add(self, documents: List[str], embeddings: List[List[float]], ids: List[str]) -> None:
-        for doc, emb, item_id in zip(documents, embeddings, ids):
-            self._rows.append({"id": item_id, "document": doc, "embedding": emb})
 
-    def query(self, query_embedding: List[float], n_results: int = 5) -> List[Dict]:
-        scored = []
-        for row in self._rows:
-            score = cosine_similarity(query_embedding, row["embedding"])
-            scored.append({"id": row["id"], "document": row["document"], "score": round(score, 4)})
-        scored.sort(key=lambda item: item["score"], reverse=True)
-        return scored[:n_results]
+def _hamming_distances(query_bits: np.ndarray, packed: np.ndarray) -> np.ndarray:
+    return np.asarray(simsimd.cdist(query_bits[np.newaxis], packed, metric="hamming", dtype="bin8"))[0]
+
+
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    if k >= scores.shape[0]:
+        return np.argsort(-scores, kind="stable")
+    # Sorting the partition first keeps ties in insertion order, like a stable full sort would.
+    top = np.sort(np.argpartition(-scores, k - 1)[:k])
+    return top[np.argsort(-scores[top], kind="stable")]
 
 
 class JobPost(BaseModel):
@@ -64,54 +357,211 @@ class JobPost(BaseModel):
     min_experience_years: int = 0
 
 
-def cosine_similarity(a: List[float], b: List[float]) -> float:
-    dot = sum(x * y for x, y in zip(a, b))
-    mag_a = sum(x * x for x in a) ** 0.5
-    mag_b = sum(y * y for y in b) ** 0.5
-    if mag_a == 0 or mag_b == 0:
-        return 0.0
-    return dot / (mag_a * mag_b)
-
-
-def _fallback_embedding(text: str, dim: int = 32) -> List[float]:
-    digest = hashlib.sha256(text.encode("utf-8")).digest()
-    return [((digest[i % len(digest)] / 255.0) * 2) - 1 for i in range(dim)]
+FALLBACK_EMBEDDING_DIM = 32
+
+
+def _fallback_embeddings(texts: List[str], dim: int = FALLBACK_EMBEDDING_DIM) -> np.ndarray:
+    digest_size = hashlib.sha256().digest_size
+    # All digests land in one (N, 32) uint8 buffer, so the scaling below runs once per batch.
+    digests = np.frombuffer(
+        b"".join(hashlib.sha256(text.encode("utf-8")).digest() for text in texts), dtype=np.uint8
+    ).reshape(len(texts), digest_size)
+    # Tiling repeats each digest cyclically, matching the old i % len(digest) indexing for dim > 32.
+    tiled = np.tile(digests, (1, -(-dim // digest_size)))[:, :dim]
+    # Unit length, like the model's normalize_embeddings=True output.
+    return _normalize_rows(tiled.astype(np.float32) * np.float32(2.0 / 255.0) - np.float32(1.0))
+
+
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+# The model's hub repo ships pre-exported ONNX graphs; the default is the dynamic int8 AVX-512 VNNI build.
+DEFAULT_ONNX_MODEL_FILE = "onnx/model_qint8_avx512_vnni.onnx"
+
+
+def _configure_torch_threads() -> None:
+    if torch is None:
+        return
+    # Some launchers leave PyTorch on a single intra-op thread; use every core this process may run on.
+    available = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    torch.set_num_threads(int(os.getenv("EMBEDDING_THREADS") or available or 1))
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Only settable before PyTorch has started any inter-op work in this process.
+        pass
+
+
+def _embedding_device() -> str:
+    override = os.getenv("EMBEDDING_DEVICE")
+    if override:
+        return override
+    if torch is None:
+        return "cpu"
+    if torch.cuda.is_available():
+        return "cuda"
+    mps = getattr(torch.backends, "mps", None)
+    if mps is not None and mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+def _load_sentence_model():
+    if SentenceTransformer is None:
+        return None
+    _configure_torch_threads()
+    if os.getenv("EMBEDDING_BACKEND", "torch").lower() == "onnx":
+        try:
+            return SentenceTransformer(
+                EMBEDDING_MODEL_NAME,
+                backend="onnx",
+                model_kwargs={"file_name": os.getenv("EMBEDDING_ONNX_FILE", DEFAULT_ONNX_MODEL_FILE)},
+            )
+        except (ImportError, OSError, TypeError, ValueError):
+            # optimum/onnxruntime missing, sentence-transformers older than 3.2, or no such ONNX file.
+            pass
+    device = _embedding_device()
+    model = SentenceTransformer(EMBEDDING_MODEL_NAME, device=device)
+    if device != "cpu":
+        # fp16 weights halve accelerator memory and use the tensor cores; encode() widens the output again.
+        model.half()
+    return model
+
+
+# Concurrent encode_one() calls are coalesced into one model call of up to
+# EMBED_BATCH_SIZE texts, waiting at most EMBED_BATCH_WAIT_SECONDS to fill it.
+EMBED_BATCH_SIZE = 32
+EMBED_BATCH_WAIT_SECONDS = 0.01
+# Recently encoded texts, keyed by the SHA-256 of their whitespace-normalized form so long resumes are not
+# held as keys. The tokenizer splits on whitespace anyway, so re-submissions differing only in spacing hit.
+EMBED_CACHE_SIZE = 10_000
 
 
 class EmbeddingService:
     def __init__(self) -> None:
-        self.model = SentenceTransformer("all-MiniLM-L6-v2") if SentenceTransformer else None
-
-    def encode(self, texts: List[str]) -> List[List[float]]:
+        # Loaded by load() from the startup hook, not at import, so importing main stays cheap.
+        self.model = None
+        self.dimension = FALLBACK_EMBEDDING_DIM
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._cache: LRUCache = LRUCache(maxsize=EMBED_CACHE_SIZE)
+
+    def load(self) -> None:
+        """Load the model once per process; later calls return immediately."""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if self._loaded:
+                return
+            self.model = _load_sentence_model()
+            if self.model:
+                self.dimension = self.model.get_sentence_embedding_dimension()
+            self._loaded = True
+
+    def encode(self, texts: List[str]) -> np.ndarray:
+        self.load()
         if self.model:
-            vectors = self.model.encode(texts)
-            return [vector.tolist() for vector in vectors]
-        return [_fallback_embedding(text) for text in texts]
+            # Unit-length rows straight from the model; float32 at the boundary even when it runs in fp16.
+            vectors = self.model.encode(
+                texts, batch_size=max(len(texts), 1), convert_to_numpy=True, normalize_embeddings=True
+            )
+            return vectors.astype(np.float32, copy=False)
+        return _fallback_embeddings(texts, self.dimension)
+
+    async def encode_one(self, text: str) -> np.ndarray:
+        self.load()
+        if not self.model:
+            # Hash fallback is cheap enough that batching would only add latency.
+            return self.encode([text])[0]
+
+        key = hashlib.sha256(" ".join(text.split()).encode("utf-8")).digest()
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        vector = await self._encode_batched(text)
+        # Cached rows are shared between requests, so hand them out read-only.
+        vector.setflags(write=False)
+        self._cache[key] = vector
+        return vector
+
+    async def _encode_batched(self, text: str) -> np.ndarray:
+        loop = asyncio.get_running_loop()
+        if self._worker_loop is not loop:
+            self._queue = asyncio.Queue()
+            self._worker_loop = loop
+            # Keep a strong reference; the event loop only holds tasks weakly.
+            self._worker = loop.create_task(self._drain_batches(self._queue))
+        future = loop.create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def _drain_batches(self, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + EMBED_BATCH_WAIT_SECONDS
+            while len(batch) < EMBED_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Similar lengths in one batch keep padding inside the transformer to a minimum.
+            batch.sort(key=lambda item: len(item[0]))
+            try:
+                vectors = await run_in_threadpool(self.encode, [text for text, _ in batch])
+            except Exception as exc:  # surface model failures to every waiting request
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
 
 
 embedder = EmbeddingService()
-resume_collection = InMemoryCollection()
+resume_collection = InMemoryCollection(dtype=EMBEDDING_STORAGE_DTYPE)
 resume_metadata: Dict[str, Dict] = {}
 
 
 @app.on_event("startup")
 def initialize_persistence() -> None:
+    embedder.load()
     init_db()
-    for record in load_freelancer_records():
-        embedding = record.get("embedding") or embedder.encode([record["resume_text"]])[0]
-        resume_collection.add(
-            documents=[record["resume_text"]],
-            embeddings=[embedding],
-            ids=[record["resume_id"]],
-        )
+    records = load_freelancer_records()
+    embeddings = [np.asarray(record.get("embedding") or [], dtype=np.float32) for record in records]
+    # Missing, or produced by a different embedding backend than the one loaded now; re-encode in batches.
+    stale = [i for i, embedding in enumerate(embeddings) if embedding.shape != (embedder.dimension,)]
+    for start in range(0, len(stale), EMBED_BATCH_SIZE):
+        batch = stale[start : start + EMBED_BATCH_SIZE]
+        for i, vector in zip(batch, embedder.encode([records[i]["resume_text"] for i in batch])):
+            embeddings[i] = vector
+    resume_collection.add(
+        documents=[record["resume_text"] for record in records],
+        embeddings=embeddings,
+        ids=[record["resume_id"] for record in records],
+    )
+
+    for record in records:
+        skills = frozenset(skill.strip().lower() for skill in record["skills"] if isinstance(skill, str))
+        experience_years = max(int(record["experience_years"]), 0)
+        experience_months = max(min(int(record.get("experience_months", 0) or 0), 11), 0)
         resume_metadata[record["resume_id"]] = {
             "name": record["name"],
             "email": record["email"],
             "headline": record["headline"],
             "bio": record["bio"],
-            "experience_years": max(int(record["experience_years"]), 0),
-            "experience_months": max(min(int(record.get("experience_months", 0) or 0), 11), 0),
-            "skills": sorted({skill.strip().lower() for skill in record["skills"] if isinstance(skill, str)}),
+            "experience_years": experience_years,
+            "experience_months": experience_months,
+            "total_months": experience_years * 12 + experience_months,
+            "skills": sorted(skills),
+            "skill_mask": _skill_mask(skills),
         }
 
 
@@ -120,8 +570,46 @@ def healthcheck() -> Dict[str, str]:
     return {"status": "ok", "service": "Freelancing AI Matching API", "ui": "/ui"}
 
 
+# IDs are persisted and upserted on conflict, so a bare counter would reuse IDs after a restart. A random
+# per-process prefix keeps them unique across processes; the counter keeps them unique within one.
+_RESUME_ID_PREFIX = base64.b32encode(os.urandom(5)).decode("ascii").lower()
+_resume_id_counter = itertools.count()
+
+
+def _next_resume_id() -> str:
+    return f"resume-{_RESUME_ID_PREFIX}{next(_resume_id_counter):06x}"
+
+
+# A registration whose background embedding keeps failing is retried this many times, waiting
+# EMBED_RETRY_DELAY_SECONDS longer before each attempt.
+EMBED_RETRY_ATTEMPTS = 3
+EMBED_RETRY_DELAY_SECONDS = 1.0
+
+
+async def _embed_and_store(resume_id: str, text: str) -> None:
+    """Embed a registered resume after the response is sent, then make it matchable and persist the vector."""
+    for attempt in range(1, EMBED_RETRY_ATTEMPTS + 1):
+        try:
+            embedding = await embedder.encode_one(text)
+            break
+        except Exception:  # the model call runs after the response, so nothing else would report it
+            if attempt == EMBED_RETRY_ATTEMPTS:
+                logger.exception(
+                    "Embedding resume %s failed %d times; it stays unmatchable until a restart re-encodes it.",
+                    resume_id,
+                    attempt,
+                )
+                return
+            logger.warning("Embedding resume %s failed (attempt %d), retrying.", resume_id, attempt, exc_info=True)
+            await asyncio.sleep(EMBED_RETRY_DELAY_SECONDS * attempt)
+    resume_collection.add(documents=[text], embeddings=[embedding], ids=[resume_id])
+    # The row is already stored with an empty embedding, which startup re-encodes if this never lands.
+    await run_in_threadpool(update_freelancer_embedding, resume_id, embedding.tolist())
+
+
 @app.post("/freelancers/register")
 async def register_freelancer(
+    background_tasks: BackgroundTasks,
     name: str = Form(...),
     email: str = Form(...),
     headline: str = Form(...),
@@ -131,21 +619,20 @@ async def register_freelancer(
     skills: str = Form(""),
     bio: str = Form(""),
     file: UploadFile = File(...),
-) -> Dict:
-    content = await file.read()
-    if not content:
+) -> Response:
+    content, size = await _read_resume_upload(file)
+    if not size:
         raise HTTPException(status_code=400, detail="Uploaded resume is empty.")
 
     text, extraction_warning = _extract_resume_text(file, content, allow_empty_resume=allow_empty_resume)
 
-    resume_id = f"resume-{uuid.uuid4().hex[:8]}"
-    embedding = embedder.encode([text])[0]
-    resume_collection.add(documents=[text], embeddings=[embedding], ids=[resume_id])
+    resume_id = _next_resume_id()
 
-    typed_skills = [skill.strip().lower() for skill in skills.split(",") if skill.strip()]
-    inferred_skills = _extract_skills(text.lower())
-    merged_skills = sorted(set(typed_skills) | set(inferred_skills))
-    extracted_years, extracted_months = _extract_experience_from_text(text.lower()) if text.strip() else (0, 0)
+    # Lower once and share the copy between both extractors.
+    lowered = text.lower()
+    typed_skills = {token for token in (skill.strip().lower() for skill in skills.split(",")) if token}
+    merged_skills = sorted(typed_skills.union(_extract_skills(lowered)))
+    extracted_years, extracted_months = _extract_experience_from_text(lowered) if lowered.strip() else (0, 0)
 
     normalized_months = max(min(experience_months, 11), 0)
     total_input_months = max(experience_years, 0) * 12 + normalized_months
@@ -159,7 +646,11 @@ async def register_freelancer(
         "bio": bio,
         "experience_years": final_total_months // 12,
         "experience_months": final_total_months % 12,
+        # Precomputed so /post-job reads experience as one number per candidate.
+        "total_months": final_total_months,
         "skills": merged_skills,
+        # Built once here so /post-job scores skill overlap with an AND and a popcount.
+        "skill_mask": _skill_mask(merged_skills),
     }
 
     upsert_freelancer_record(
@@ -172,8 +663,9 @@ async def register_freelancer(
         experience_months=resume_metadata[resume_id]["experience_months"],
         skills=merged_skills,
         resume_text=text,
-        embedding=embedding,
+        embedding=[],
     )
+    background_tasks.add_task(_embed_and_store, resume_id, text)
 
     response = {
         "message": "Freelancer registered successfully",
@@ -182,23 +674,25 @@ async def register_freelancer(
     }
     if extraction_warning:
         response["warning"] = extraction_warning
-    return response
+    # Returned as a ready response so FastAPI skips jsonable_encoder and response-model validation.
+    return JSON_RESPONSE_CLASS(response)
 
 
 @app.post("/upload-resume")
 async def upload_resume(file: UploadFile = File(...), allow_empty_resume: bool = Form(False)) -> Dict:
-    content = await file.read()
-    if not content:
+    content, size = await _read_resume_upload(file)
+    if not size:
         raise HTTPException(status_code=400, detail="Uploaded resume is empty.")
 
     text, extraction_warning = _extract_resume_text(file, content, allow_empty_resume=allow_empty_resume)
 
-    resume_id = f"resume-{uuid.uuid4().hex[:8]}"
-    embedding = embedder.encode([text])[0]
+    resume_id = _next_resume_id()
+    embedding = await embedder.encode_one(text)
     resume_collection.add(documents=[text], embeddings=[embedding], ids=[resume_id])
 
     lowered = text.lower() if text.strip() else ""
     extracted_years, extracted_months = _extract_experience_from_text(lowered)
+    skills = _extract_skills(lowered)
     resume_metadata[resume_id] = {
         "name": file.filename,
         "email": "",
@@ -206,7 +700,9 @@ async def upload_resume(file: UploadFile = File(...), allow_empty_resume: bool =
         "bio": "",
         "experience_years": extracted_years,
         "experience_months": extracted_months,
-        "skills": _extract_skills(lowered),
+        "total_months": max(extracted_years, 0) * 12 + max(extracted_months, 0),
+        "skills": skills,
+        "skill_mask": _skill_mask(skills),
     }
 
     upsert_freelancer_record(
@@ -219,7 +715,7 @@ async def upload_resume(file: UploadFile = File(...), allow_empty_resume: bool =
         experience_months=resume_metadata[resume_id]["experience_months"],
         skills=resume_metadata[resume_id]["skills"],
         resume_text=text,
-        embedding=embedding,
+        embedding=embedding.tolist(),
     )
 
     response = {"message": "Resume stored successfully", "resume_id": resume_id}
@@ -228,42 +724,84 @@ async def upload_resume(file: UploadFile = File(...), allow_empty_resume: bool =
     return response
 
 
+@functools.lru_cache(maxsize=1024)
+def _required_skill_mask(skills: Tuple[str, ...], vocabulary_size: int) -> Tuple[int, int]:
+    """Mask of the required skills some resume could have, and how many distinct skills were asked for.
+
+    Job posts never allocate bits: a skill no resume has cannot match, so it only counts in the denominator.
+    Clients tend to resubmit the same skill list while tweaking a job post; bits never move and only get added,
+    so keying on the vocabulary size keeps cached masks valid.
+    """
+    required = {skill.lower() for skill in skills}
+    mask = 0
+    for skill in required:
+        bit = _SKILL_BITS.get(skill)
+        if bit is not None:
+            mask |= 1 << bit
+    return mask, len(required)
+
+
 @app.post("/post-job")
-def post_job(job: JobPost) -> Dict:
+async def post_job(job: JobPost) -> Response:
     if not resume_metadata:
         raise HTTPException(status_code=404, detail="No resumes found. Upload resumes first.")
 
-    job_embedding = embedder.encode([job.description])[0]
-    semantic_matches = resume_collection.query(query_embedding=job_embedding, n_results=10)
-
-    ranked = []
-    for result in semantic_matches:
-        candidate = resume_metadata.get(result["id"], {"skills": [], "experience_years": 0, "experience_months": 0})
-        candidate_total_months = max(candidate["experience_years"], 0) * 12 + max(candidate.get("experience_months", 0), 0)
-        required_total_months = max(job.min_experience_years, 0) * 12
-        experience_score = min(candidate_total_months / max(required_total_months, 1), 1.0)
-
-        required = {skill.lower() for skill in job.required_skills}
-        available = set(candidate["skills"])
-        skill_score = len(required & available) / max(len(required), 1)
+    job_embedding = await embedder.encode_one(job.description)
+    # Registrations still being embedded are not in resume_collection yet, so they never show up here.
+    # The scan is O(N * D) below HNSW_MIN_ROWS, so it runs in the threadpool rather than stalling the loop.
+    ids, similarities = await run_in_threadpool(resume_collection.query, job_embedding, 10)
+
+    missing = {
+        "skills": [],
+        "skill_mask": 0,
+        "experience_years": 0,
+        "experience_months": 0,
+        "total_months": 0,
+    }
+    candidates = [resume_metadata.get(resume_id, missing) for resume_id in ids]
+    required_mask, required_count = _required_skill_mask(tuple(job.required_skills), len(_SKILL_BITS))
+    required_total_months = max(job.min_experience_years, 0) * 12
 
-        final_score = round((0.5 * skill_score) + (0.3 * experience_score) + (0.2 * result["score"]), 4)
-        ranked.append(
+    # Gather the two per-candidate inputs, then score everyone in one array expression.
+    candidate_months = np.fromiter(
+        (candidate["total_months"] for candidate in candidates), dtype=np.float64, count=len(candidates)
+    )
+    skill_hits = np.fromiter(
+        ((candidate["skill_mask"] & required_mask).bit_count() for candidate in candidates),
+        dtype=np.float64,
+        count=len(candidates),
+    )
+    skill_scores = skill_hits / max(required_count, 1)
+    experience_scores = np.minimum(candidate_months / max(required_total_months, 1), 1.0)
+    final_scores = 0.5 * skill_scores + 0.3 * experience_scores + 0.2 * similarities.astype(np.float64)
+
+    # Scores stay raw while ranking; only the five returned matches are rounded, for display.
+    top_matches = []
+    for i in _top_k_indices(final_scores, 5).tolist():
+        candidate = candidates[i]
+        top_matches.append(
             {
-                "resume_id": result["id"],
-                "name": candidate.get("name", result["id"]),
+                "resume_id": ids[i],
+                "name": candidate.get("name", ids[i]),
                 "headline": candidate.get("headline", "Freelancer"),
-                "semantic_score": result["score"],
-                "skill_score": round(skill_score, 4),
-                "experience_score": round(experience_score, 4),
+                "semantic_score": round(float(similarities[i]), 4),
+                "skill_score": round(float(skill_scores[i]), 4),
+                "experience_score": round(float(experience_scores[i]), 4),
                 "experience_years": candidate.get("experience_years", 0),
                 "experience_months": candidate.get("experience_months", 0),
-                "final_score": final_score,
+                "final_score": round(float(final_scores[i]), 4),
             }
         )
+    return JSON_RESPONSE_CLASS({"top_matches": top_matches, "rows_html": _match_rows_html(top_matches)})
+
 
-    ranked.sort(key=lambda item: item["final_score"], reverse=True)
-    return {"top_matches": ranked[:5]}
+def _match_rows_html(top_matches: List[Dict]) -> str:
+    # Pre-rendered, escaped <tbody> rows for the inline jobs page, so the browser just assigns innerHTML.
+    return "".join(
+        f"<tr><td>{html.escape(str(match['name']))}</td><td>{html.escape(str(match['headline']))}</td>"
+        f"<td>{match['final_score']}</td><td>{match['skill_score']}</td><td>{match['experience_score']}</td></tr>"
+        for match in top_matches
+    )
 
 
 @app.get("/freelancers")
@@ -272,7 +810,37 @@ def get_freelancers(limit: int = 100) -> Dict[str, List[Dict]]:
     return {"count": len(profiles), "freelancers": profiles}
 
 
-def _extract_resume_text(file: UploadFile, content: bytes, allow_empty_resume: bool = False) -> Tuple[str, str]:
+MAX_RESUME_BYTES = 10 * 1024 * 1024
+UPLOAD_CHUNK_BYTES = 64 * 1024
+# Formats read as plain UTF-8; everything else is handed to a parser as bytes.
+_TEXT_RESUME_EXTENSIONS = (".txt", ".doc")
+
+
+async def _read_resume_upload(file: UploadFile) -> Tuple[Union[bytes, str], int]:
+    """Read an upload in chunks, decoding text formats as they arrive; 413 once past MAX_RESUME_BYTES."""
+    is_text = (file.filename or "").lower().endswith(_TEXT_RESUME_EXTENSIONS)
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore") if is_text else None
+    decoded = io.StringIO()
+    chunks: List[bytes] = []
+    size = 0
+    while chunk := await file.read(UPLOAD_CHUNK_BYTES):
+        size += len(chunk)
+        if size > MAX_RESUME_BYTES:
+            raise HTTPException(
+                status_code=413, detail=f"Resume exceeds the {MAX_RESUME_BYTES // (1024 * 1024)} MB upload limit."
+            )
+        if decoder:
+            decoded.write(decoder.decode(chunk))
+        else:
+            chunks.append(chunk)
+
+    if decoder:
+        decoded.write(decoder.decode(b"", final=True))
+        return decoded.getvalue(), size
+    return b"".join(chunks), size
+
+
+def _extract_resume_text(file: UploadFile, content: Union[bytes, str], allow_empty_resume: bool = False) -> Tuple[str, str]:
     filename = (file.filename or "").lower()
     extension = "." + filename.rsplit(".", 1)[-1] if "." in filename else ""
 
@@ -282,8 +850,11 @@ def _extract_resume_text(file: UploadFile, content: bytes, allow_empty_resume: b
             return fallback_text, detail
         raise HTTPException(status_code=400, detail=detail)
 
+    def _as_text() -> str:
+        return content if isinstance(content, str) else content.decode("utf-8", errors="ignore")
+
     if filename.endswith(".txt"):
-        text = content.decode("utf-8", errors="ignore").strip()
+        text = _as_text().strip()
         if text:
             return text, ""
         return _empty_text_fallback("TXT has no readable text content.")
@@ -318,7 +889,7 @@ def _extract_resume_text(file: UploadFile, content: bytes, allow_empty_resume: b
 
     if filename.endswith(".doc"):
         # Legacy .doc is binary and not reliably parseable without external converters.
-        decoded = content.decode("utf-8", errors="ignore").strip()
+        decoded = _as_text().strip()
         if decoded:
             return decoded, "Legacy DOC parsed with fallback decoder. Convert to DOCX for better accuracy."
         return _empty_text_fallback(
@@ -328,12 +899,18 @@ def _extract_resume_text(file: UploadFile, content: bytes, allow_empty_resume: b
     raise HTTPException(status_code=400, detail="Unsupported resume format. Upload TXT, PDF, DOCX, or DOC.")
 
 
+_YEARS_RE = re.compile(r"(\d{1,2})\s*\+?\s*(?:years?|yrs?)")
+_MONTHS_RE = re.compile(r"(\d{1,2})\s*\+?\s*(?:months?|mos?)")
+# A whitespace-delimited, all-digit token whose value is 1-50 (leading zeros allowed, as int() would).
+_BARE_NUMBER_RE = re.compile(r"(?<!\S)0*([1-9]|[1-4]\d|50)(?!\S)")
+
+
 def _extract_experience_from_text(resume_text_lower: str) -> tuple[int, int]:
     years = 0
     months = 0
 
-    year_match = re.search(r"(\d{1,2})\s*\+?\s*(?:years?|yrs?)", resume_text_lower)
-    month_match = re.search(r"(\d{1,2})\s*\+?\s*(?:months?|mos?)", resume_text_lower)
+    year_match = _YEARS_RE.search(resume_text_lower)
+    month_match = _MONTHS_RE.search(resume_text_lower)
 
     if year_match:
         years = max(0, min(int(year_match.group(1)), 50))
@@ -341,18 +918,16 @@ def _extract_experience_from_text(resume_text_lower: str) -> tuple[int, int]:
         months = max(0, min(int(month_match.group(1)), 11))
 
     if years == 0 and months == 0:
-        for token in resume_text_lower.split():
-            if token.isdigit():
-                value = int(token)
-                if 0 < value < 51:
-                    years = value
-                    break
+        # The range check lives in the pattern, so the first match is the answer.
+        bare_number = _BARE_NUMBER_RE.search(resume_text_lower)
+        if bare_number:
+            years = int(bare_number.group(1))
 
     return years, months
 
 
-def _extract_skills(resume_text_lower: str) -> List[str]:
-    common_skills = {
+COMMON_SKILLS = frozenset(
+    {
         "python",
         "fastapi",
         "django",
@@ -365,4 +940,51 @@ def _extract_skills(resume_text_lower: str) -> List[str]:
         "docker",
         "kubernetes",
     }
-    return sorted(skill for skill in common_skills if skill in resume_text_lower)
+)
+
+
+def _build_skill_automaton():
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for skill in COMMON_SKILLS:
+        automaton.add_word(skill, skill)
+    automaton.make_automaton()
+    return automaton
+
+
+# Finds every skill in one pass over the text instead of one substring scan per skill.
+_SKILL_AUTOMATON = _build_skill_automaton()
+# Without pyahocorasick: one regex pass that tries every skill at each position, longest first. The lookahead
+# lets matches overlap; a skill hidden inside a longer match at the same spot is recovered via _SKILL_CONTAINS.
+_SKILL_RE = re.compile(
+    "(?=(" + "|".join(re.escape(skill) for skill in sorted(COMMON_SKILLS, key=len, reverse=True)) + "))"
+)
+_SKILL_CONTAINS = {skill: frozenset(other for other in COMMON_SKILLS if other in skill) for skill in COMMON_SKILLS}
+
+
+# One bit per skill some resume has. The extractor's vocabulary comes first; skills typed at registration get
+# the next free bit on first sight, and Python ints simply grow wider past 64 of them. Only resumes allocate
+# bits, so client job posts cannot grow this table.
+_SKILL_BITS: Dict[str, int] = {skill: bit for bit, skill in enumerate(sorted(COMMON_SKILLS))}
+_skill_bits_lock = threading.Lock()
+
+
+def _skill_mask(skills: Iterable[str]) -> int:
+    mask = 0
+    for skill in skills:
+        bit = _SKILL_BITS.get(skill)
+        if bit is None:
+            with _skill_bits_lock:
+                bit = _SKILL_BITS.setdefault(skill, len(_SKILL_BITS))
+        mask |= 1 << bit
+    return mask
+
+
+def _extract_skills(resume_text_lower: str) -> List[str]:
+    if _SKILL_AUTOMATON is not None:
+        return sorted({skill for _, skill in _SKILL_AUTOMATON.iter(resume_text_lower)})
+    found = set()
+    for match in _SKILL_RE.finditer(resume_text_lower):
+        found |= _SKILL_CONTAINS[match.group(1)]
+    return sorted(found)
@@ -35,7 +35,7 @@ def wait_for_health(url: str, retries: int = 30, delay_s: int = 1) -> bool:
 
 
 def find_missing_packages() -> list[str]:
-    required = ["fastapi", "uvicorn", "multipart", "requests", "certifi", "pypdf", "docx"]
+    required = ["fastapi", "uvicorn", "multipart", "requests", "certifi", "pypdf", "docx", "httpx", "cachetools", "jinja2", "numpy"]
     return [pkg for pkg in required if importlib.util.find_spec(pkg) is None]
 
 
@@ -53,15 +53,27 @@ def main() -> None:
             "pip",
             "install",
             "fastapi",
+            "pydantic>=2",
             "uvicorn",
             "python-multipart",
             "requests",
             "certifi",
             "pypdf",
             "python-docx",
+            "httpx",
+            "redis",
+            "cachetools",
+            "jinja2",
+            "orjson",
+            "numpy",
         ],
         check=False,
     )
+    # Optional native accelerators; the app falls back without them, so a missing wheel must not block the rest.
+    run(
+        [str(venv_python), "-m", "pip", "install", "minijinja", "brotli", "simsimd", "usearch", "pyahocorasick"],
+        check=False,
+    )
     run([str(venv_python), "-m", "pip", "install", "sentence-transformers"], check=False)
 
     missing = find_missing_packages()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import functools
+import gzip
+import hashlib
+from typing import Dict, FrozenSet, Tuple
+
+from fastapi import Request
+from fastapi.responses import Response
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+
+class StaticPage:
+    """A body that never changes: ETag and compressed variants are computed once, when the page is built."""
+
+    def __init__(self, body: bytes, media_type: str = "text/html", cache_control: str = "public, max-age=300"):
+        self.body = body
+        self.media_type = media_type
+        digest = hashlib.md5(body, usedforsecurity=False).hexdigest()
+        self.etag = f'"{digest}"'
+        self.headers = {"ETag": self.etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+        # Precompressed bodies in preference order, so no per-request compression is needed. Each is a distinct
+        # representation, so each gets its own strong ETag.
+        compressed = {"gzip": ("gz", gzip.compress(body, compresslevel=9))}
+        if brotli is not None:
+            compressed = {"br": ("br", brotli.compress(body, quality=11)), **compressed}
+        self.encoded: Dict[str, Tuple[bytes, Dict[str, str]]] = {
+            encoding: (encoded_body, {**self.headers, "ETag": f'"{digest}-{suffix}"'})
+            for encoding, (suffix, encoded_body) in compressed.items()
+        }
+
+    def response(self, request: Request) -> Response:
+        body, headers, content_encoding = self.body, self.headers, None
+        accepted, refused = _parse_accept_encoding(request.headers.get("accept-encoding", ""))
+        for encoding, (encoded_body, encoded_headers) in self.encoded.items():
+            if encoding in accepted or ("*" in accepted and encoding not in refused):
+                body, headers, content_encoding = encoded_body, encoded_headers, encoding
+                break
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            tags = _parse_if_none_match(if_none_match)
+            if "*" in tags or headers["ETag"] in tags:
+                return Response(status_code=304, headers=headers)
+        if content_encoding is not None:
+            headers = {**headers, "Content-Encoding": content_encoding}
+        return Response(body, media_type=self.media_type, headers=headers)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_if_none_match(header: str) -> FrozenSet[str]:
+    """Entity tags listed in If-None-Match, with any W/ prefix dropped: revalidation uses weak comparison."""
+    tags = set()
+    for tag in header.split(","):
+        tag = tag.strip()
+        tags.add(tag[2:] if tag.startswith("W/") else tag)
+    return frozenset(tags)
+
+
+# Browsers send one of a handful of Accept-Encoding values, so each is parsed once.
+@functools.lru_cache(maxsize=64)
+def _parse_accept_encoding(header: str) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """Split an Accept-Encoding header into codings with q > 0 and codings refused with q=0."""
+    accepted = set()
+    refused = set()
+    for part in header.split(","):
+        coding, _, params = part.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        (accepted if quality > 0 else refused).add(coding)
+    return frozenset(accepted), frozenset(refused)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 import tempfile
+import time
 from pathlib import Path
 
 import requests
@@ -50,10 +51,15 @@ def main() -> None:
         "required_skills": ["python", "fastapi", "aws"],
         "min_experience_years": 3,
     }
-    match = requests.post(f"{BASE}/post-job", json=payload, timeout=20)
-    assert_status(match, 200, "Job matching failed")
+    # Registration embeds the resume in the background, so it can take a moment to become matchable.
+    for _ in range(20):
+        match = requests.post(f"{BASE}/post-job", json=payload, timeout=20)
+        assert_status(match, 200, "Job matching failed")
+        data = match.json()
+        if data.get("top_matches"):
+            break
+        time.sleep(0.25)
 
-    data = match.json()
     if "top_matches" not in data or not isinstance(data["top_matches"], list):
         raise RuntimeError(f"Unexpected /post-job response: {json.dumps(data)}")
     if not data["top_matches"]:
@@ -1,14 +1,48 @@
 from __future__ import annotations
 
+import threading
 from pathlib import Path
+from typing import Optional, Tuple
 
-from fastapi import APIRouter
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.responses import FileResponse, HTMLResponse, Response
+from fastapi.staticfiles import StaticFiles
 
-ui_router = APIRouter(tags=["ui"])
+from static_pages import StaticPage
+
+# Browser pages, not API: kept out of the OpenAPI schema and /docs.
+ui_router = APIRouter(tags=["ui"], include_in_schema=False)
 
 ROOT_DIR = Path(__file__).resolve().parents[2]
 FRONTEND_DIST_DIR = ROOT_DIR / "frontend" / "dist"
+FRONTEND_INDEX_FILE = FRONTEND_DIST_DIR / "index.html"
+FRONTEND_ASSETS_DIR = FRONTEND_DIST_DIR / "assets"
+INDEX_CACHE_CONTROL = "public, max-age=300"
+# Vite puts a content hash in every file name under assets/, so a given URL never changes.
+ASSET_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+_index_lock = threading.Lock()
+_index_cache: Optional[Tuple[Tuple[int, int], StaticPage]] = None
+
+
+def _cached_index() -> StaticPage:
+    # Keyed on mtime and size so a rebuilt frontend is picked up without a restart.
+    global _index_cache
+    stat = FRONTEND_INDEX_FILE.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _index_cache
+    if cached is None or cached[0] != key:
+        with _index_lock:
+            cached = _index_cache
+            if cached is None or cached[0] != key:
+                cached = (key, StaticPage(FRONTEND_INDEX_FILE.read_bytes(), cache_control=INDEX_CACHE_CONTROL))
+                _index_cache = cached
+    return cached[1]
+
+
+def _index_response(request: Request) -> Response:
+    return _cached_index().response(request)
 
 
 def _missing_build_response() -> HTMLResponse:
@@ -30,22 +64,41 @@ npm run build</pre>
     )
 
 
-def _frontend_response(path: str = ""):
-    if not FRONTEND_DIST_DIR.exists():
+def _frontend_response(request: Request, path: str = ""):
+    if not FRONTEND_INDEX_FILE.is_file():
         return _missing_build_response()
 
     safe_path = Path(path.strip("/"))
     candidate = (FRONTEND_DIST_DIR / safe_path).resolve()
     if str(candidate).startswith(str(FRONTEND_DIST_DIR.resolve())) and candidate.is_file():
+        if candidate.name == "index.html" and candidate.parent == FRONTEND_DIST_DIR.resolve():
+            return _index_response(request)
         return FileResponse(candidate)
-    return FileResponse(FRONTEND_DIST_DIR / "index.html")
+    return _index_response(request)
 
 
 @ui_router.get("/ui", response_class=HTMLResponse)
-def serve_ui_root():
-    return _frontend_response()
+def serve_ui_root(request: Request):
+    return _frontend_response(request)
 
 
 @ui_router.get("/ui/{path:path}")
-def serve_ui_path(path: str):
-    return _frontend_response(path)
+def serve_ui_path(request: Request, path: str):
+    return _frontend_response(request, path)
+
+
+class _HashedAssetFiles(StaticFiles):
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = ASSET_CACHE_CONTROL
+        return response
+
+
+def mount_frontend_assets(app: FastAPI) -> None:
+    """Serve the build's hashed assets straight from StaticFiles; call before including ui_router.
+
+    Skipped when there is no build yet: /ui/{path} then still serves assets of a later build, just without
+    the long-lived cache header.
+    """
+    if FRONTEND_ASSETS_DIR.is_dir():
+        app.mount("/ui/assets", _HashedAssetFiles(directory=FRONTEND_ASSETS_DIR), name="ui-assets")
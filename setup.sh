@@ -40,7 +40,9 @@ fi
 "$PYTHON_BIN" -m venv .venv --system-site-packages
 
 "$VENV_PYTHON" -m pip install --upgrade pip || true
-"$VENV_PYTHON" -m pip install fastapi uvicorn python-multipart requests certifi pypdf python-docx || true
+"$VENV_PYTHON" -m pip install fastapi "pydantic>=2" uvicorn python-multipart requests certifi pypdf python-docx httpx redis cachetools jinja2 orjson numpy || true
+# Optional native accelerators; the app falls back without them, so a missing wheel must not block the rest.
+"$VENV_PYTHON" -m pip install minijinja brotli simsimd usearch pyahocorasick || true
 "$VENV_PYTHON" -m pip install sentence-transformers || true
 
 (
@@ -56,12 +58,15 @@ fi
 
 "$VENV_PYTHON" - <<'PY'
 import importlib.util
-required = ["fastapi", "uvicorn", "multipart", "requests", "certifi", "pypdf", "docx"]
+required = ["fastapi", "uvicorn", "multipart", "requests", "certifi", "pypdf", "docx", "httpx", "cachetools", "jinja2", "numpy"]
 missing = [pkg for pkg in required if importlib.util.find_spec(pkg) is None]
 if missing:
     raise SystemExit(f"Missing required packages in venv: {missing}")
 PY
 
+# The inline UI minifies its page scripts at import; make sure node still parses the result.
+"$VENV_PYTHON" backend/scripts/inline_ui_routes.py
+
 "$VENV_PYTHON" -m uvicorn main:app --app-dir backend/scripts --host 127.0.0.1 --port 8000 > "$LOG_FILE" 2>&1 &
 SERVER_PID=$!
 